@@ -2,6 +2,7 @@
 Reply submission endpoints
 """
 
+import asyncio
 from uuid import UUID
 from typing import List, Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
@@ -16,6 +17,7 @@ from utils.auth import get_current_team, get_current_user
 from services.social_platforms import get_platform_service
 from tasks.reply_tasks import submit_reply_to_platform
 from utils.task_queue import task_queue
+from utils.token_tracker import TokenTracker
 
 
 router = APIRouter()
@@ -94,10 +96,8 @@ async def submit_reply(
     
     db.add(reply)
     await db.commit()
-    await db.refresh(reply)
     
     # Track token usage for reply processing
-    from utils.token_tracker import TokenTracker
     token_tracker = TokenTracker()
 
     await token_tracker.track_usage(
@@ -149,15 +149,19 @@ async def submit_bulk_replies(
     failed_replies = []
     job_ids = []
     
+    # Load every targeted comment that belongs to the team in one query
+    stmt = select(Comment).where(
+        Comment.comment_id.in_({item.comment_id for item in request.replies}),
+        Comment.team_id == team_id
+    )
+    result = await db.execute(stmt)
+    comments_by_id = {comment.comment_id: comment for comment in result.scalars()}
+    
+    saved_replies = []
     for reply_item in request.replies:
         try:
             # Validate comment exists and belongs to team
-            stmt = select(Comment).where(
-                Comment.comment_id == reply_item.comment_id,
-                Comment.team_id == team_id
-            )
-            result = await db.execute(stmt)
-            comment = result.scalar_one_or_none()
+            comment = comments_by_id.get(reply_item.comment_id)
             
             if not comment:
                 failed_replies.append({
@@ -175,22 +179,7 @@ async def submit_bulk_replies(
             
             db.add(reply)
             await db.commit()
-            await db.refresh(reply)
-            
-            # Queue reply submission
-            job_id = await task_queue.enqueue_reply_submission(
-                reply.reply_id, 
-                comment.platform, 
-                team_id
-            )
-            job_ids.append(job_id)
-            
-            successful_replies.append(ReplyResponse(
-                reply_id=reply.reply_id,
-                message=reply.message,
-                status="queued",
-                submitted_at=reply.created_at
-            ))
+            saved_replies.append((reply_item, reply, comment))
             
         except Exception as e:
             failed_replies.append({
@@ -198,6 +187,31 @@ async def submit_bulk_replies(
                 "error": str(e)
             })
     
+    # Queue reply submissions concurrently so broker round-trips overlap
+    enqueue_results = await asyncio.gather(
+        *(
+            task_queue.enqueue_reply_submission(reply.reply_id, comment.platform, team_id)
+            for _, reply, comment in saved_replies
+        ),
+        return_exceptions=True
+    )
+    
+    for (reply_item, reply, _), job_id in zip(saved_replies, enqueue_results):
+        if isinstance(job_id, Exception):
+            failed_replies.append({
+                "comment_id": str(reply_item.comment_id),
+                "error": str(job_id)
+            })
+            continue
+        
+        job_ids.append(job_id)
+        successful_replies.append(ReplyResponse(
+            reply_id=reply.reply_id,
+            message=reply.message,
+            status="queued",
+            submitted_at=reply.created_at
+        ))
+    
     return BulkReplyValidatedResponse(
         total_submitted=len(successful_replies),
         successful=successful_replies,
@@ -12,9 +12,8 @@ from pydantic import BaseModel
 from models.database import Comment, Team, AiSuggestion
 from utils.database import get_db
 from utils.auth import get_current_team
-from services.llm_service import LLMService
-from services.vector_service import VectorService
 from utils.token_tracker import TokenTracker
+from utils.task_queue import task_queue
 
 
 router = APIRouter()
@@ -97,7 +96,6 @@ async def get_suggestions(
         )
     
     # Queue suggestion generation task
-    from utils.task_queue import task_queue
     job_id = await task_queue.enqueue_suggestion_generation(comment_id, team_id)
     
     return SuggestionsResponse(
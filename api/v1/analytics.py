@@ -5,11 +5,12 @@ RESTful analytics endpoints for token usage and performance metrics
 from uuid import UUID
 from typing import Dict, Any, Optional
 from datetime import datetime, timedelta
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func
 
-from models.database import Team
-from utils.database import get_db
+from models.database import Team, Comment, Reply, AiSuggestion
+from utils.database import get_db, get_session
 from utils.auth import get_current_team
 from utils.token_tracker import TokenTracker
 from schemas.responses import TokenQuotaResponse
@@ -77,9 +78,6 @@ async def get_performance_metrics(
         )
     
     # Get performance metrics from database
-    from sqlalchemy import select, func
-    from models.database import Comment, Reply, AiSuggestion
-    
     async with get_session() as db:
         # Comment processing metrics
         comment_stats = await db.execute(
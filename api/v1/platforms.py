@@ -4,13 +4,15 @@ RESTful platform management endpoints
 
 from uuid import UUID
 from typing import List
+from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update
 
-from models.database import Team
+from models.database import Team, SocialConnection
 from utils.database import get_db
 from utils.auth import get_current_team
-from services.platforms.registry import get_platform_service
+from services.platforms.registry import get_platform_service, platform_registry
 from services.platforms.base import OnboardingConfig, ConnectionConfig
 from schemas.requests import OnboardingRequest, TokenExchangeRequest, ConnectionRequest
 from schemas.responses import OnboardingResponse, ConnectionResponse
@@ -22,7 +24,6 @@ router = APIRouter()
 @router.get("/", response_model=List[str])
 async def list_platforms():
     """List all supported platforms"""
-    from services.platforms.registry import platform_registry
     return platform_registry.list_platforms()
 
 
@@ -83,9 +84,6 @@ async def list_platform_connections(
 ) -> List[ConnectionResponse]:
     """List all connections for a platform"""
     
-    from sqlalchemy import select
-    from models.database import SocialConnection
-    
     stmt = select(SocialConnection).where(
         SocialConnection.team_id == current_team.team_id,
         SocialConnection.platform == platform
@@ -118,10 +116,6 @@ async def disconnect_platform(
         platform_service = get_platform_service(platform)
         
         # Find and disconnect
-        from sqlalchemy import select, update
-        from models.database import SocialConnection
-        from datetime import datetime
-        
         stmt = select(SocialConnection).where(
             SocialConnection.connection_id == connection_id,
             SocialConnection.team_id == current_team.team_id,
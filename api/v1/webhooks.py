@@ -7,12 +7,28 @@ from utils.webhook_security import webhook_security
 from utils.task_queue import task_queue
 from schemas.responses import WebhookResponse
 from utils.exceptions import handle_platform_error
+from utils.fast_json import loads
 from utils.logging import get_logger
+from schemas.webhook_schemas import (
+    InstagramWebhookPayload,
+    TwitterWebhookPayload,
+    YouTubeWebhookPayload,
+    LinkedInWebhookPayload
+)
 from typing import Dict, Any
+from types import MappingProxyType
 
 router = APIRouter()
 logger = get_logger(__name__)
 
+# Platform-specific payload models, built once at import time
+WEBHOOK_PAYLOAD_VALIDATORS = MappingProxyType({
+    "instagram": InstagramWebhookPayload,
+    "twitter": TwitterWebhookPayload,
+    "youtube": YouTubeWebhookPayload,
+    "linkedin": LinkedInWebhookPayload
+})
+
 
 @router.post("/{platform}", response_model=WebhookResponse)
 async def handle_platform_webhook(
@@ -38,7 +54,7 @@ async def handle_platform_webhook(
         
         # Parse and validate JSON payload with platform-specific models
         try:
-            json_data = await request.json()
+            json_data = loads(body)
             validated_payload = await _validate_webhook_payload(platform, json_data)
         except Exception as e:
             await webhook_security.log_webhook_attempt(platform, request, False, f"Invalid payload: {str(e)}")
@@ -106,21 +122,7 @@ async def handle_webhook_challenge(
 
 async def _validate_webhook_payload(platform: str, json_data: Dict[str, Any]):
     """Validate webhook payload with platform-specific Pydantic models"""
-    from schemas.webhook_schemas import (
-        InstagramWebhookPayload,
-        TwitterWebhookPayload,
-        YouTubeWebhookPayload,
-        LinkedInWebhookPayload
-    )
-    
-    validators = {
-        "instagram": InstagramWebhookPayload,
-        "twitter": TwitterWebhookPayload,
-        "youtube": YouTubeWebhookPayload,
-        "linkedin": LinkedInWebhookPayload
-    }
-    
-    validator_class = validators.get(platform.lower())
+    validator_class = WEBHOOK_PAYLOAD_VALIDATORS.get(platform.lower())
     if not validator_class:
         raise ValueError(f"No validator for platform: {platform}")
     
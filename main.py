@@ -3,6 +3,7 @@ PulsePilot Backend API - Production-ready with all 20 enhancements applied
 """
 
 import os
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -23,6 +24,8 @@ from middleware.rate_limiting import RateLimitingMiddleware
 from middleware.token_tracking_middleware import TokenTrackingMiddleware
 from utils.error_handler import GlobalExceptionHandler
 from migrations.migration_manager import migration_manager
+from services.platforms.registry import platform_registry
+from utils.http_client import close_async_client
 from schemas.responses import HealthResponse
 
 logger = get_structured_logger(__name__)
@@ -62,6 +65,8 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("🛑 Application shutting down")
+    await platform_registry.aclose()
+    await close_async_client()
 
 
 # Initialize FastAPI app with OpenAPI alignment
@@ -131,25 +136,24 @@ async def health_check() -> dict:
     from utils.database import get_session
     from tasks.async_task_manager import task_manager
     
-    # Check dependencies
-    dependencies = {}
-    
-    try:
-        # Test database connection
+    async def check_database():
         async with get_session() as db:
             await db.execute("SELECT 1")
-        dependencies["database"] = "healthy"
-    except Exception as e:
-        dependencies["database"] = "unhealthy"
-        logger.error("Database health check failed", error=str(e))
     
-    try:
-        # Test Redis connection
-        await task_manager.get_pool()
-        dependencies["redis"] = "healthy"
-    except Exception as e:
-        dependencies["redis"] = "unhealthy"
-        logger.error("Redis health check failed", error=str(e))
+    # Check dependencies concurrently so latency is the slowest probe, not the sum
+    dependencies = {}
+    checks = {
+        "database": check_database(),
+        "redis": task_manager.get_pool(),
+    }
+    results = await asyncio.gather(*checks.values(), return_exceptions=True)
+    
+    for name, result in zip(checks, results):
+        if isinstance(result, Exception):
+            dependencies[name] = "unhealthy"
+            logger.error(f"{name.capitalize()} health check failed", error=str(result))
+        else:
+            dependencies[name] = "healthy"
     
     # Add feature flag status
     dependencies["feature_flags"] = "enabled" if settings_registry.is_enabled else "disabled"
@@ -3,12 +3,32 @@ Canonical schemas for normalizing social media data
 """
 
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
 from uuid import UUID
 from pydantic import BaseModel, Field, validator
 from enum import Enum
 
 
+TWITTER_TIME_FORMAT = "%a %b %d %H:%M:%S %z %Y"
+
+# Timestamps repeat within a batch (publishedAt == updatedAt, bursts of
+# comments in the same second) and datetimes are immutable, so cache them
+TIMESTAMP_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def _parse_iso(ts: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp (Python 3.11+ accepts a trailing 'Z')"""
+    return datetime.fromisoformat(ts) if ts else None
+
+
+@lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def _parse_twitter_time(ts: Optional[str]) -> Optional[datetime]:
+    """Parse a Twitter v1.1 created_at timestamp"""
+    return datetime.strptime(ts, TWITTER_TIME_FORMAT) if ts else None
+
+
 class PlatformType(str, Enum):
     """Supported social media platforms"""
     INSTAGRAM = "instagram"
@@ -155,7 +175,7 @@ class CommentNormalizer:
             author=author,
             post=post,
             message=raw_data.get("text", ""),
-            created_at=datetime.fromisoformat(raw_data.get("timestamp", datetime.utcnow().isoformat())),
+            created_at=_parse_iso(raw_data.get("timestamp")) or datetime.utcnow(),
             platform_metadata=raw_data
         )
     
@@ -163,6 +183,8 @@ class CommentNormalizer:
     def normalize_twitter_comment(raw_data: Dict[str, Any]) -> CanonicalComment:
         """Normalize Twitter comment data"""
         user_data = raw_data.get("user", {})
+        # Tweet and reply share one timestamp; strptime is slow, so parse it once
+        created_at = _parse_twitter_time(raw_data.get("created_at"))
         
         author = CanonicalAuthor(
             external_id=user_data.get("id_str", ""),
@@ -177,7 +199,7 @@ class CommentNormalizer:
             external_id=raw_data.get("in_reply_to_status_id_str", ""),
             content_type=ContentType.TEXT,
             text=raw_data.get("text", ""),
-            created_at=datetime.strptime(raw_data.get("created_at", ""), "%a %b %d %H:%M:%S %z %Y") if raw_data.get("created_at") else None
+            created_at=created_at
         )
         
         return CanonicalComment(
@@ -186,7 +208,7 @@ class CommentNormalizer:
             author=author,
             post=post,
             message=raw_data.get("text", ""),
-            created_at=datetime.strptime(raw_data.get("created_at", ""), "%a %b %d %H:%M:%S %z %Y") if raw_data.get("created_at") else datetime.utcnow(),
+            created_at=created_at or datetime.utcnow(),
             parent_comment_id=raw_data.get("in_reply_to_status_id_str"),
             engagement_metrics={
                 "retweets": raw_data.get("retweet_count", 0),
@@ -219,8 +241,8 @@ class CommentNormalizer:
             author=author,
             post=post,
             message=snippet.get("textDisplay", ""),
-            created_at=datetime.fromisoformat(snippet.get("publishedAt", datetime.utcnow().isoformat()).replace("Z", "+00:00")),
-            updated_at=datetime.fromisoformat(snippet.get("updatedAt", datetime.utcnow().isoformat()).replace("Z", "+00:00")) if snippet.get("updatedAt") else None,
+            created_at=_parse_iso(snippet.get("publishedAt")) or datetime.utcnow(),
+            updated_at=_parse_iso(snippet.get("updatedAt")),
             parent_comment_id=snippet.get("parentId"),
             engagement_metrics={
                 "likes": snippet.get("likeCount", 0)
@@ -250,6 +272,6 @@ class CommentNormalizer:
             author=author,
             post=post,
             message=comment_data.get("message", {}).get("text", ""),
-            created_at=datetime.fromisoformat(comment_data.get("created", {}).get("time", datetime.utcnow().isoformat())),
+            created_at=_parse_iso(comment_data.get("created", {}).get("time")) or datetime.utcnow(),
             platform_metadata=raw_data
         )
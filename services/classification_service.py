@@ -3,6 +3,7 @@ Comment classification service for sentiment, emotion, and category analysis
 """
 
 import os
+from functools import lru_cache
 from typing import Dict, Any
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
@@ -86,3 +87,9 @@ Consider the context and nuances of social media communication. Be precise and c
                 "confidence": 0.0,
                 "error": str(e)
             }
+
+
+@lru_cache()
+def get_classification_service() -> ClassificationService:
+    """Get the process-wide ClassificationService so the LLM client is built once"""
+    return ClassificationService()
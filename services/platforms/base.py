@@ -8,6 +8,8 @@ from uuid import UUID
 from datetime import datetime
 from pydantic import BaseModel
 
+from utils.http_client import get_async_client
+
 
 class PlatformConnectionData(BaseModel):
     """Standardized platform connection data"""
@@ -64,3 +66,10 @@ class BasePlatformService(ABC):
     async def post_reply(self, comment_id: str, message: str, access_token: str) -> Dict[str, Any]:
         """Post reply to platform"""
         pass
+    
+    async def aclose(self) -> None:
+        """Release pooled HTTP connections owned by the service"""
+        client = getattr(self, "client", None)
+        # The shared client is closed once by the application on shutdown
+        if client is not None and client is not get_async_client():
+            await client.aclose()
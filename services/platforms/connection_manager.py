@@ -74,7 +74,6 @@ class ConnectionManager:
                     
                     db.add(connection)
                     await db.commit()
-                    await db.refresh(connection)
                     
                     return ConnectionResponse(
                         connection_id=connection.connection_id,
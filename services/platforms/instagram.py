@@ -2,14 +2,15 @@
 Instagram platform service implementation
 """
 
-import hmac
-import hashlib
 from typing import Dict, Any, List
 from uuid import UUID
 import httpx
 
 from .base import BasePlatformService, PlatformConnectionData, PlatformWebhookData
 from utils.config import get_config
+from utils.http_client import get_async_client
+from utils.fast_json import response_json
+from utils.webhook_security import SHA256_PREFIX, hmac_template, verify_hmac_signature
 
 
 class InstagramService(BasePlatformService):
@@ -17,8 +18,11 @@ class InstagramService(BasePlatformService):
     
     def __init__(self):
         self.base_url = "https://graph.instagram.com"
-        self.client = httpx.AsyncClient()
+        self._me_url = f"{self.base_url}/me"
+        self._permissions_url = f"{self.base_url}/me/permissions"
+        self.client = get_async_client()
         self.config = get_config()
+        self._hmac_template = hmac_template(self.config.instagram_app_secret)
     
     @property
     def platform_name(self) -> str:
@@ -28,11 +32,11 @@ class InstagramService(BasePlatformService):
         """Validate Instagram access token"""
         try:
             response = await self.client.get(
-                f"{self.base_url}/me",
+                self._me_url,
                 params={"access_token": access_token}
             )
             return response.status_code == 200
-        except Exception:
+        except httpx.HTTPError:
             return False
     
     async def connect_team(self, team_id: UUID, connection_data: PlatformConnectionData) -> Dict[str, Any]:
@@ -54,36 +58,42 @@ class InstagramService(BasePlatformService):
         """Disconnect team from Instagram"""
         return True
     
+    async def revoke_token(self, access_token: str) -> bool:
+        """Revoke Instagram access token"""
+        try:
+            response = await self.client.delete(
+                self._permissions_url,
+                params={"access_token": access_token}
+            )
+            return response.status_code == 200
+        except httpx.HTTPError:
+            return False
+    
     async def process_webhook(self, payload: Dict[str, Any], headers: Dict[str, str]) -> List[PlatformWebhookData]:
         """Process Instagram webhook and extract comments"""
-        comments = []
-        for entry in payload.get("entry", []):
-            for change in entry.get("changes", []):
-                if change.get("field") == "comments":
-                    value = change.get("value", {})
-                    comment = PlatformWebhookData(
-                        external_id=value.get("id", ""),
-                        author=value.get("from", {}).get("username"),
-                        message=value.get("text", ""),
-                        post_id=value.get("media", {}).get("id"),
-                        platform_metadata={"instagram_data": value}
-                    )
-                    comments.append(comment)
-        return comments
+        # Graph API delivers these fields already typed as strings, so skip
+        # per-item pydantic validation and build the models directly
+        return [
+            PlatformWebhookData.model_construct(
+                external_id=value.get("id", ""),
+                author=(value.get("from") or {}).get("username"),
+                message=value.get("text", ""),
+                post_id=(value.get("media") or {}).get("id"),
+                platform_metadata={"instagram_data": value}
+            )
+            for entry in payload.get("entry", ())
+            for change in entry.get("changes", ())
+            if change.get("field") == "comments"
+            for value in (change.get("value") or {},)
+        ]
     
     async def verify_webhook_signature(self, body: bytes, headers: Dict[str, str]) -> bool:
         """Verify Instagram webhook signature"""
         signature = headers.get("x-hub-signature-256", "")
-        if not signature:
+        if not signature.startswith(SHA256_PREFIX) or self._hmac_template is None:
             return False
         
-        expected_signature = "sha256=" + hmac.new(
-            self.config.instagram_app_secret.encode(),
-            body,
-            hashlib.sha256
-        ).hexdigest()
-        
-        return hmac.compare_digest(signature, expected_signature)
+        return await verify_hmac_signature(self._hmac_template, body, signature[len(SHA256_PREFIX):])
     
     async def post_reply(self, comment_id: str, message: str, access_token: str) -> Dict[str, Any]:
         """Post reply to Instagram comment"""
@@ -92,4 +102,4 @@ class InstagramService(BasePlatformService):
             data={"message": message, "access_token": access_token}
         )
         response.raise_for_status()
-        return response.json()
+        return response_json(response)
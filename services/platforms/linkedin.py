@@ -2,14 +2,28 @@
 LinkedIn platform service implementation
 """
 
-import hmac
-import hashlib
 from typing import Dict, Any, List
 from uuid import UUID
 import httpx
 
-from .base import BasePlatformService, ConnectionConfig, WebhookPayload, CommentData
+from .base import BasePlatformService, PlatformConnectionData, PlatformWebhookData
 from utils.config import get_config
+from utils.http_client import get_async_client
+from utils.fast_json import response_json
+from utils.webhook_security import hmac_template, verify_hmac_signature
+
+
+# Header names arrive lowercased from Starlette's request headers
+SIGNATURE_HEADER = "x-linkedin-signature"
+
+
+def _auth_headers(access_token: str) -> Dict[str, str]:
+    """LinkedIn request headers for a token"""
+    # Built per call rather than cached, so bearer tokens aren't kept in memory
+    return {
+        "Authorization": f"Bearer {access_token}",
+        "X-Restli-Protocol-Version": "2.0.0"
+    }
 
 
 class LinkedInService(BasePlatformService):
@@ -17,75 +31,69 @@ class LinkedInService(BasePlatformService):
     
     def __init__(self):
         self.base_url = "https://api.linkedin.com/v2"
-        self.client = httpx.AsyncClient()
+        self._people_me_url = f"{self.base_url}/people/~"
+        self.client = get_async_client()
         self.config = get_config()
+        self._hmac_template = hmac_template(self.config.linkedin_client_secret)
     
     @property
     def platform_name(self) -> str:
         return "linkedin"
     
-    async def connect(self, team_id: UUID, config: ConnectionConfig) -> Dict[str, Any]:
+    async def validate_connection(self, access_token: str) -> bool:
+        """Validate LinkedIn access token"""
+        try:
+            response = await self.client.get(
+                self._people_me_url,
+                headers=_auth_headers(access_token)
+            )
+            return response.status_code == 200
+        except httpx.HTTPError:
+            return False
+    
+    async def connect_team(self, team_id: UUID, connection_data: PlatformConnectionData) -> Dict[str, Any]:
         """Connect team to LinkedIn"""
-        is_valid = await self.validate_token(config.access_token)
+        is_valid = await self.validate_connection(connection_data.access_token)
         if not is_valid:
             raise ValueError("Invalid LinkedIn access token")
         
         return {
             "platform": self.platform_name,
             "status": "connected",
-            "access_token": config.access_token,
-            "refresh_token": config.refresh_token,
-            "token_expires": config.token_expires,
-            "metadata": config.metadata or {}
+            "access_token": connection_data.access_token,
+            "refresh_token": connection_data.refresh_token,
+            "token_expires": connection_data.token_expires,
+            "metadata": connection_data.metadata
         }
     
-    async def disconnect(self, team_id: UUID, connection_id: UUID) -> bool:
+    async def disconnect_team(self, team_id: UUID, connection_id: UUID) -> bool:
         """Disconnect team from LinkedIn"""
         return True
     
-    async def ingest_webhook(self, payload: WebhookPayload) -> List[CommentData]:
-        """Process LinkedIn webhook and extract comments"""
-        if not await self._verify_signature(payload.body, payload.headers):
-            raise ValueError("Invalid webhook signature")
-        
-        comments = []
-        for event in payload.json_data.get("events", []):
-            if event.get("eventType") == "COMMENT_CREATED":
-                comment_info = event.get("comment", {})
-                comment = CommentData(
-                    external_id=comment_info.get("id", ""),
-                    author=comment_info.get("author"),
-                    message=comment_info.get("message", {}).get("text"),
-                    post_id=comment_info.get("object"),
-                    platform_metadata={
-                        "linkedin_data": event
-                    }
-                )
-                comments.append(comment)
-        
-        return comments
-    
-    async def validate_token(self, access_token: str) -> bool:
-        """Validate LinkedIn access token"""
-        try:
-            response = await self.client.get(
-                f"{self.base_url}/people/~",
-                headers={"Authorization": f"Bearer {access_token}"}
-            )
-            return response.status_code == 200
-        except Exception:
-            return False
-    
     async def revoke_token(self, access_token: str) -> bool:
         """Revoke LinkedIn access token"""
         # LinkedIn doesn't have direct revoke endpoint
         return True
     
+    async def process_webhook(self, payload: Dict[str, Any], headers: Dict[str, str]) -> List[PlatformWebhookData]:
+        """Process LinkedIn webhook and extract comments"""
+        return [
+            PlatformWebhookData.model_construct(
+                external_id=(comment_info := event.get("comment") or {}).get("id", ""),
+                author=comment_info.get("author"),
+                message=(comment_info.get("message") or {}).get("text", ""),
+                post_id=comment_info.get("object"),
+                platform_metadata={"linkedin_data": event}
+            )
+            for event in payload.get("events") or ()
+            if event.get("eventType") == "COMMENT_CREATED"
+        ]
+    
     async def post_reply(self, comment_id: str, message: str, access_token: str) -> Dict[str, Any]:
         """Post reply to LinkedIn comment"""
         response = await self.client.post(
             f"{self.base_url}/socialActions/{comment_id}/comments",
-            headers={"Authorization": f"Bearer {access_token}"},
+            headers=_auth_headers(access_token),
             json={
                 "message": {
                     "text": message
@@ -93,22 +101,12 @@ class LinkedInService(BasePlatformService):
             }
         )
         response.raise_for_status()
-        return response.json()
+        return response_json(response)
     
-    async def _verify_signature(self, body: bytes, headers: Dict[str, str]) -> bool:
+    async def verify_webhook_signature(self, body: bytes, headers: Dict[str, str]) -> bool:
         """Verify LinkedIn webhook signature"""
-        signature = headers.get("x-linkedin-signature", "")
-        if not signature:
+        signature = headers.get(SIGNATURE_HEADER)
+        if not signature or self._hmac_template is None:
             return False
         
-        client_secret = self.config.linkedin_client_secret
-        if not client_secret:
-            return False
-        
-        expected_signature = hmac.new(
-            client_secret.encode(),
-            body,
-            hashlib.sha256
-        ).hexdigest()
-        
-        return hmac.compare_digest(signature, expected_signature)
+        return await verify_hmac_signature(self._hmac_template, body, signature)
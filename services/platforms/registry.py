@@ -2,7 +2,8 @@
 Platform service registry for dependency injection
 """
 
-from typing import Dict, Type, Optional
+from types import MappingProxyType
+from typing import Dict, Mapping, Type, Optional
 from .base import BasePlatformService
 from .instagram import InstagramService
 from .twitter import TwitterService
@@ -14,29 +15,40 @@ class PlatformRegistry:
     """Registry for platform services"""
     
     def __init__(self):
-        self._services: Dict[str, Type[BasePlatformService]] = {
+        self._services: Mapping[str, Type[BasePlatformService]] = MappingProxyType({
             "instagram": InstagramService,
             "twitter": TwitterService,
             "youtube": YouTubeService,
             "linkedin": LinkedInService,
-        }
+        })
         self._instances: Dict[str, BasePlatformService] = {}
     
     def get_service(self, platform: str) -> Optional[BasePlatformService]:
         """Get platform service instance"""
-        platform = platform.lower()
-        
-        if platform not in self._services:
-            return None
+        # Webhook routes pass lowercase names, so a built service is one lookup away
+        service = self._instances.get(platform)
+        if service is not None:
+            return service
         
-        if platform not in self._instances:
-            self._instances[platform] = self._services[platform]()
+        platform = platform.lower()
+        service = self._instances.get(platform)
+        if service is None:
+            service_class = self._services.get(platform)
+            if service_class is None:
+                return None
+            service = self._instances[platform] = service_class()
         
-        return self._instances[platform]
+        return service
     
     def list_platforms(self) -> list[str]:
         """List all supported platforms"""
         return list(self._services.keys())
+    
+    async def aclose(self) -> None:
+        """Close HTTP clients of all instantiated platform services"""
+        for service in self._instances.values():
+            await service.aclose()
+        self._instances.clear()
 
 
 # Global registry instance
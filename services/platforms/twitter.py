@@ -2,15 +2,18 @@
 Twitter/X platform service implementation
 """
 
-import os
-import hmac
-import hashlib
 from typing import Dict, Any, List
 from uuid import UUID
 import httpx
 
-from .base import BasePlatformService, ConnectionConfig, WebhookPayload, CommentData
+from .base import BasePlatformService, PlatformConnectionData, PlatformWebhookData
 from utils.config import get_config
+from utils.http_client import get_async_client
+from utils.fast_json import response_json
+from utils.webhook_security import SHA256_PREFIX, hmac_template, verify_hmac_signature
+
+
+SIGNATURE_HEADER = "x-twitter-webhooks-signature"
 
 
 class TwitterService(BasePlatformService):
@@ -18,64 +21,46 @@ class TwitterService(BasePlatformService):
     
     def __init__(self):
         self.base_url = "https://api.twitter.com/2"
-        self.client = httpx.AsyncClient()
+        self._users_me_url = f"{self.base_url}/users/me"
+        self._tweets_url = f"{self.base_url}/tweets"
+        self.client = get_async_client()
         self.config = get_config()
+        self._hmac_template = hmac_template(self.config.twitter_consumer_secret)
     
     @property
     def platform_name(self) -> str:
         return "twitter"
     
-    async def connect(self, team_id: UUID, config: ConnectionConfig) -> Dict[str, Any]:
+    async def validate_connection(self, access_token: str) -> bool:
+        """Validate Twitter access token"""
+        try:
+            response = await self.client.get(
+                self._users_me_url,
+                headers={"Authorization": f"Bearer {access_token}"}
+            )
+            return response.status_code == 200
+        except httpx.HTTPError:
+            return False
+    
+    async def connect_team(self, team_id: UUID, connection_data: PlatformConnectionData) -> Dict[str, Any]:
         """Connect team to Twitter"""
-        is_valid = await self.validate_token(config.access_token)
+        is_valid = await self.validate_connection(connection_data.access_token)
         if not is_valid:
             raise ValueError("Invalid Twitter access token")
         
         return {
             "platform": self.platform_name,
             "status": "connected",
-            "access_token": config.access_token,
-            "refresh_token": config.refresh_token,
-            "token_expires": config.token_expires,
-            "metadata": config.metadata or {}
+            "access_token": connection_data.access_token,
+            "refresh_token": connection_data.refresh_token,
+            "token_expires": connection_data.token_expires,
+            "metadata": connection_data.metadata
         }
     
-    async def disconnect(self, team_id: UUID, connection_id: UUID) -> bool:
+    async def disconnect_team(self, team_id: UUID, connection_id: UUID) -> bool:
         """Disconnect team from Twitter"""
         return True
     
-    async def ingest_webhook(self, payload: WebhookPayload) -> List[CommentData]:
-        """Process Twitter webhook and extract comments"""
-        if not await self._verify_signature(payload.body, payload.headers):
-            raise ValueError("Invalid webhook signature")
-        
-        comments = []
-        for tweet in payload.json_data.get("tweet_create_events", []):
-            if tweet.get("in_reply_to_status_id"):
-                comment = CommentData(
-                    external_id=tweet.get("id_str", ""),
-                    author=tweet.get("user", {}).get("screen_name"),
-                    message=tweet.get("text"),
-                    post_id=tweet.get("in_reply_to_status_id"),
-                    platform_metadata={
-                        "twitter_data": tweet
-                    }
-                )
-                comments.append(comment)
-        
-        return comments
-    
-    async def validate_token(self, access_token: str) -> bool:
-        """Validate Twitter access token"""
-        try:
-            response = await self.client.get(
-                f"{self.base_url}/users/me",
-                headers={"Authorization": f"Bearer {access_token}"}
-            )
-            return response.status_code == 200
-        except Exception:
-            return False
-    
     async def revoke_token(self, access_token: str) -> bool:
         """Revoke Twitter access token"""
         try:
@@ -84,13 +69,36 @@ class TwitterService(BasePlatformService):
                 data={"token": access_token}
             )
             return response.status_code == 200
-        except Exception:
+        except httpx.HTTPError:
+            return False
+    
+    async def process_webhook(self, payload: Dict[str, Any], headers: Dict[str, str]) -> List[PlatformWebhookData]:
+        """Process Twitter webhook and extract comments"""
+        # Only replies are comments; skip top-level tweets before building anything
+        return [
+            PlatformWebhookData.model_construct(
+                external_id=tweet.get("id_str", ""),
+                author=(tweet.get("user") or {}).get("screen_name"),
+                message=tweet.get("text", ""),
+                post_id=str(reply_to),
+                platform_metadata={"twitter_data": tweet}
+            )
+            for tweet in payload.get("tweet_create_events", ())
+            if (reply_to := tweet.get("in_reply_to_status_id"))
+        ]
+    
+    async def verify_webhook_signature(self, body: bytes, headers: Dict[str, str]) -> bool:
+        """Verify Twitter webhook signature"""
+        signature = headers.get(SIGNATURE_HEADER, "")
+        if not signature.startswith(SHA256_PREFIX) or self._hmac_template is None:
             return False
+        
+        return await verify_hmac_signature(self._hmac_template, body, signature[len(SHA256_PREFIX):])
     
     async def post_reply(self, comment_id: str, message: str, access_token: str) -> Dict[str, Any]:
         """Post reply to Twitter tweet"""
         response = await self.client.post(
-            f"{self.base_url}/tweets",
+            self._tweets_url,
             headers={"Authorization": f"Bearer {access_token}"},
             json={
                 "text": message,
@@ -98,22 +106,4 @@ class TwitterService(BasePlatformService):
             }
         )
         response.raise_for_status()
-        return response.json()
-    
-    async def _verify_signature(self, body: bytes, headers: Dict[str, str]) -> bool:
-        """Verify Twitter webhook signature"""
-        signature = headers.get("x-twitter-webhooks-signature", "")
-        if not signature:
-            return False
-        
-        consumer_secret = self.config.twitter_consumer_secret
-        if not consumer_secret:
-            return False
-        
-        expected_signature = "sha256=" + hmac.new(
-            consumer_secret.encode(),
-            body,
-            hashlib.sha256
-        ).hexdigest()
-        
-        return hmac.compare_digest(signature, expected_signature)
+        return response_json(response)
@@ -6,8 +6,10 @@ from typing import Dict, Any, List
 from uuid import UUID
 import httpx
 
-from .base import BasePlatformService, ConnectionConfig, WebhookPayload, CommentData
+from .base import BasePlatformService, PlatformConnectionData, PlatformWebhookData
 from utils.config import get_config
+from utils.http_client import get_async_client
+from utils.fast_json import response_json
 
 
 class YouTubeService(BasePlatformService):
@@ -15,57 +17,20 @@ class YouTubeService(BasePlatformService):
     
     def __init__(self):
         self.base_url = "https://www.googleapis.com/youtube/v3"
-        self.client = httpx.AsyncClient()
+        self._channels_url = f"{self.base_url}/channels"
+        self._comments_url = f"{self.base_url}/comments"
+        self.client = get_async_client()
         self.config = get_config()
     
     @property
     def platform_name(self) -> str:
         return "youtube"
     
-    async def connect(self, team_id: UUID, config: ConnectionConfig) -> Dict[str, Any]:
-        """Connect team to YouTube"""
-        is_valid = await self.validate_token(config.access_token)
-        if not is_valid:
-            raise ValueError("Invalid YouTube access token")
-        
-        return {
-            "platform": self.platform_name,
-            "status": "connected",
-            "access_token": config.access_token,
-            "refresh_token": config.refresh_token,
-            "token_expires": config.token_expires,
-            "metadata": config.metadata or {}
-        }
-    
-    async def disconnect(self, team_id: UUID, connection_id: UUID) -> bool:
-        """Disconnect team from YouTube"""
-        return True
-    
-    async def ingest_webhook(self, payload: WebhookPayload) -> List[CommentData]:
-        """Process YouTube webhook and extract comments"""
-        # YouTube uses PubSubHubbub, simplified processing
-        comments = []
-        
-        if "comment" in payload.json_data:
-            comment_info = payload.json_data["comment"]
-            comment = CommentData(
-                external_id=comment_info.get("id", ""),
-                author=comment_info.get("authorDisplayName"),
-                message=comment_info.get("textDisplay"),
-                post_id=comment_info.get("videoId"),
-                platform_metadata={
-                    "youtube_data": comment_info
-                }
-            )
-            comments.append(comment)
-        
-        return comments
-    
-    async def validate_token(self, access_token: str) -> bool:
+    async def validate_connection(self, access_token: str) -> bool:
         """Validate YouTube access token"""
         try:
             response = await self.client.get(
-                f"{self.base_url}/channels",
+                self._channels_url,
                 params={
                     "part": "id",
                     "mine": "true",
@@ -73,9 +38,28 @@ class YouTubeService(BasePlatformService):
                 }
             )
             return response.status_code == 200
-        except Exception:
+        except httpx.HTTPError:
             return False
     
+    async def connect_team(self, team_id: UUID, connection_data: PlatformConnectionData) -> Dict[str, Any]:
+        """Connect team to YouTube"""
+        is_valid = await self.validate_connection(connection_data.access_token)
+        if not is_valid:
+            raise ValueError("Invalid YouTube access token")
+        
+        return {
+            "platform": self.platform_name,
+            "status": "connected",
+            "access_token": connection_data.access_token,
+            "refresh_token": connection_data.refresh_token,
+            "token_expires": connection_data.token_expires,
+            "metadata": connection_data.metadata
+        }
+    
+    async def disconnect_team(self, team_id: UUID, connection_id: UUID) -> bool:
+        """Disconnect team from YouTube"""
+        return True
+    
     async def revoke_token(self, access_token: str) -> bool:
         """Revoke YouTube access token"""
         try:
@@ -84,13 +68,35 @@ class YouTubeService(BasePlatformService):
                 data={"token": access_token}
             )
             return response.status_code == 200
-        except Exception:
+        except httpx.HTTPError:
             return False
     
+    async def process_webhook(self, payload: Dict[str, Any], headers: Dict[str, str]) -> List[PlatformWebhookData]:
+        """Process YouTube webhook and extract comments"""
+        # YouTube uses PubSubHubbub, simplified processing
+        comment_info = payload.get("comment")
+        if not comment_info:
+            return []
+        
+        return [
+            PlatformWebhookData.model_construct(
+                external_id=comment_info.get("id", ""),
+                author=comment_info.get("authorDisplayName"),
+                message=comment_info.get("textDisplay", ""),
+                post_id=comment_info.get("videoId"),
+                platform_metadata={"youtube_data": comment_info}
+            )
+        ]
+    
+    async def verify_webhook_signature(self, body: bytes, headers: Dict[str, str]) -> bool:
+        """Verify YouTube webhook (PubSubHubbub doesn't use signatures)"""
+        # Subscriptions are verified through the hub.challenge handshake instead
+        return True
+    
     async def post_reply(self, comment_id: str, message: str, access_token: str) -> Dict[str, Any]:
         """Post reply to YouTube comment"""
         response = await self.client.post(
-            f"{self.base_url}/comments",
+            self._comments_url,
             params={"access_token": access_token},
             json={
                 "snippet": {
@@ -100,4 +106,4 @@ class YouTubeService(BasePlatformService):
             }
         )
         response.raise_for_status()
-        return response.json()
+        return response_json(response)
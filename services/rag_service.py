@@ -2,7 +2,8 @@
 RAG (Retrieval-Augmented Generation) service for AI reply suggestions
 """
 
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, text
@@ -146,3 +147,9 @@ Tone: Helpful and engaging
 Guidelines: Be responsive, helpful, and maintain brand consistency
 Do Not: Avoid controversial topics, be overly promotional
 """
+
+
+@lru_cache()
+def get_rag_service() -> RAGService:
+    """Get the process-wide RAGService shared by suggestion tasks"""
+    return RAGService()
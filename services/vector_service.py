@@ -3,8 +3,10 @@ Vector embedding and similarity search service
 """
 
 import os
+from functools import lru_cache, partial
 from typing import List, Optional
 from uuid import UUID
+import anyio
 from sentence_transformers import SentenceTransformer
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, text
@@ -14,6 +16,10 @@ from models.database import Comment
 from utils.database import get_session
 
 
+# Maximum embedding encodes running in worker threads at once
+ENCODE_CONCURRENCY = 4
+
+
 class VectorService:
     """Service for generating embeddings and performing similarity search"""
     
@@ -21,6 +27,9 @@ class VectorService:
         # Initialize sentence transformer model
         self.model = SentenceTransformer('all-MiniLM-L6-v2')
         self.embedding_dim = 384  # all-MiniLM-L6-v2 produces 384-dim embeddings
+        # Bounds concurrent encodes in worker threads; created lazily because
+        # anyio limiters must be built inside a running event loop
+        self._encode_limiter: Optional[anyio.CapacityLimiter] = None
     
     async def generate_embedding(self, text: str) -> List[float]:
         """Generate embedding for text"""
@@ -28,8 +37,14 @@ class VectorService:
             return [0.0] * self.embedding_dim
         
         try:
-            # Generate embedding
-            embedding = self.model.encode(text.strip())
+            # Encode in a worker thread so the CPU-bound model call does not
+            # block the event loop
+            if self._encode_limiter is None:
+                self._encode_limiter = anyio.CapacityLimiter(ENCODE_CONCURRENCY)
+            embedding = await anyio.to_thread.run_sync(
+                partial(self.model.encode, text.strip()),
+                limiter=self._encode_limiter
+            )
             return embedding.tolist()
         except Exception as e:
             raise Exception(f"Embedding generation failed: {str(e)}")
@@ -124,3 +139,9 @@ class VectorService:
                 
             except Exception as e:
                 raise Exception(f"Failed to update embedding: {str(e)}")
+
+
+@lru_cache()
+def get_vector_service() -> VectorService:
+    """Get the process-wide VectorService so the embedding model loads once"""
+    return VectorService()
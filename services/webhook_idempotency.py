@@ -3,6 +3,7 @@ Webhook idempotency service for safe retry handling
 """
 
 import hashlib
+import json
 from typing import Dict, Any, Optional, List
 from uuid import UUID
 from datetime import datetime, timedelta
@@ -215,9 +216,8 @@ class WebhookIdempotencyService:
         Returns:
             SHA-256 hash of payload
         """
-        import json
-        
-        # Sort keys for deterministic hashing
+        # Sort keys for deterministic hashing; keep the default ASCII escaping so
+        # hashes match the ones already stored in webhook_events
         payload_str = json.dumps(payload, sort_keys=True, separators=(',', ':'))
         return hashlib.sha256(payload_str.encode()).hexdigest()
 
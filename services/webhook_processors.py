@@ -3,15 +3,16 @@ Webhook processors for different social media platforms
 """
 
 import os
-import hmac
-import hashlib
 import json
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
+from types import MappingProxyType
 from uuid import uuid4
-from datetime import datetime
+from datetime import datetime, timezone
 
 from models.database import Comment
+from utils.webhook_security import hmac_template, verify_hmac_signature
 
 
 class BaseWebhookProcessor(ABC):
@@ -28,96 +29,89 @@ class BaseWebhookProcessor(ABC):
         pass
 
 
-class InstagramWebhookProcessor(BaseWebhookProcessor):
-    """Instagram webhook processor"""
+class HmacWebhookProcessor(BaseWebhookProcessor):
+    """Webhook processor verified by an HMAC-SHA256 signature header"""
+    
+    # Declared per platform by subclasses
+    signature_header: str
+    secret_env: str
+    signature_prefix: str = ""
+    
+    def __init__(self):
+        self._hmac_template = hmac_template(os.getenv(self.secret_env))
     
     async def verify_signature(self, body: bytes, headers: Dict[str, str]) -> bool:
-        """Verify Instagram webhook signature"""
-        signature = headers.get("x-hub-signature-256", "")
-        if not signature:
+        """Verify webhook signature against the platform secret"""
+        signature = headers.get(self.signature_header, "")
+        if not signature.startswith(self.signature_prefix) or self._hmac_template is None:
             return False
         
-        app_secret = os.getenv("INSTAGRAM_APP_SECRET")
-        if not app_secret:
-            return False
-        
-        expected_signature = "sha256=" + hmac.new(
-            app_secret.encode(),
+        return await verify_hmac_signature(
+            self._hmac_template,
             body,
-            hashlib.sha256
-        ).hexdigest()
-        
-        return hmac.compare_digest(signature, expected_signature)
+            signature[len(self.signature_prefix):]
+        )
+
+
+class InstagramWebhookProcessor(HmacWebhookProcessor):
+    """Instagram webhook processor"""
+    
+    signature_header = "x-hub-signature-256"
+    secret_env = "INSTAGRAM_APP_SECRET"
+    signature_prefix = "sha256="
     
     async def process_webhook(self, payload: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Process Instagram webhook payload"""
-        comments = []
-        
-        for entry in payload.get("entry", []):
-            for change in entry.get("changes", []):
-                if change.get("field") == "comments":
-                    value = change.get("value", {})
-                    
-                    comment_data = {
-                        "comment_id": str(uuid4()),
-                        "platform": "instagram",
-                        "external_id": value.get("id"),
-                        "author": value.get("from", {}).get("username"),
-                        "message": value.get("text"),
-                        "post_id": value.get("media", {}).get("id"),
-                        "metadata": {
-                            "instagram_data": value,
-                            "webhook_timestamp": datetime.utcnow().isoformat()
-                        }
-                    }
-                    comments.append(comment_data)
+        webhook_timestamp = datetime.now(timezone.utc).isoformat()
         
-        return comments
+        return [
+            {
+                "comment_id": str(uuid4()),
+                "platform": "instagram",
+                "external_id": value.get("id"),
+                "author": value.get("from", {}).get("username"),
+                "message": value.get("text"),
+                "post_id": value.get("media", {}).get("id"),
+                "metadata": {
+                    "instagram_data": value,
+                    "webhook_timestamp": webhook_timestamp
+                }
+            }
+            for entry in payload.get("entry", [])
+            for change in entry.get("changes", [])
+            if change.get("field") == "comments"
+            for value in (change.get("value", {}),)
+        ]
 
 
-class TwitterWebhookProcessor(BaseWebhookProcessor):
+class TwitterWebhookProcessor(HmacWebhookProcessor):
     """Twitter webhook processor"""
     
-    async def verify_signature(self, body: bytes, headers: Dict[str, str]) -> bool:
-        """Verify Twitter webhook signature"""
-        signature = headers.get("x-twitter-webhooks-signature", "")
-        if not signature:
-            return False
-        
-        consumer_secret = os.getenv("TWITTER_CONSUMER_SECRET")
-        if not consumer_secret:
-            return False
-        
-        expected_signature = "sha256=" + hmac.new(
-            consumer_secret.encode(),
-            body,
-            hashlib.sha256
-        ).hexdigest()
-        
-        return hmac.compare_digest(signature, expected_signature)
+    signature_header = "x-twitter-webhooks-signature"
+    secret_env = "TWITTER_CONSUMER_SECRET"
+    signature_prefix = "sha256="
     
     async def process_webhook(self, payload: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Process Twitter webhook payload"""
-        comments = []
+        webhook_timestamp = datetime.now(timezone.utc).isoformat()
         
         # Handle tweet replies
-        for tweet in payload.get("tweet_create_events", []):
-            if tweet.get("in_reply_to_status_id"):
-                comment_data = {
-                    "comment_id": str(uuid4()),
-                    "platform": "twitter",
-                    "external_id": tweet.get("id_str"),
-                    "author": tweet.get("user", {}).get("screen_name"),
-                    "message": tweet.get("text"),
-                    "post_id": tweet.get("in_reply_to_status_id"),
-                    "metadata": {
-                        "twitter_data": tweet,
-                        "webhook_timestamp": datetime.utcnow().isoformat()
-                    }
+        return [
+            {
+                "comment_id": str(uuid4()),
+                "platform": "twitter",
+                "external_id": tweet.get("id_str"),
+                "author": tweet.get("user", {}).get("screen_name"),
+                "message": tweet.get("text"),
+                "post_id": tweet.get("in_reply_to_status_id"),
+                "metadata": {
+                    "twitter_data": tweet,
+                    "webhook_timestamp": webhook_timestamp
                 }
-                comments.append(comment_data)
-        
-        return comments
+            }
+            for tweet in payload.get("tweet_create_events", [])
+            if tweet.get("in_reply_to_status_id")
+        ]
 
 
 class YouTubeWebhookProcessor(BaseWebhookProcessor):
@@ -144,7 +138,7 @@ class YouTubeWebhookProcessor(BaseWebhookProcessor):
                 "post_id": payload.get("comment", {}).get("videoId"),
                 "metadata": {
                     "youtube_data": payload,
-                    "webhook_timestamp": datetime.utcnow().isoformat()
+                    "webhook_timestamp": datetime.now(timezone.utc).isoformat()
                 }
             }
             comments.append(comment_data)
@@ -152,62 +146,53 @@ class YouTubeWebhookProcessor(BaseWebhookProcessor):
         return comments
 
 
-class LinkedInWebhookProcessor(BaseWebhookProcessor):
+class LinkedInWebhookProcessor(HmacWebhookProcessor):
     """LinkedIn webhook processor"""
     
-    async def verify_signature(self, body: bytes, headers: Dict[str, str]) -> bool:
-        """Verify LinkedIn webhook signature"""
-        signature = headers.get("x-linkedin-signature", "")
-        if not signature:
-            return False
-        
-        client_secret = os.getenv("LINKEDIN_CLIENT_SECRET")
-        if not client_secret:
-            return False
-        
-        expected_signature = hmac.new(
-            client_secret.encode(),
-            body,
-            hashlib.sha256
-        ).hexdigest()
-        
-        return hmac.compare_digest(signature, expected_signature)
+    signature_header = "x-linkedin-signature"
+    secret_env = "LINKEDIN_CLIENT_SECRET"
     
     async def process_webhook(self, payload: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Process LinkedIn webhook payload"""
-        comments = []
+        webhook_timestamp = datetime.now(timezone.utc).isoformat()
         
-        for event in payload.get("events", []):
-            if event.get("eventType") == "COMMENT_CREATED":
-                comment_data = {
-                    "comment_id": str(uuid4()),
-                    "platform": "linkedin",
-                    "external_id": event.get("comment", {}).get("id"),
-                    "author": event.get("comment", {}).get("author"),
-                    "message": event.get("comment", {}).get("message", {}).get("text"),
-                    "post_id": event.get("comment", {}).get("object"),
-                    "metadata": {
-                        "linkedin_data": event,
-                        "webhook_timestamp": datetime.utcnow().isoformat()
-                    }
+        return [
+            {
+                "comment_id": str(uuid4()),
+                "platform": "linkedin",
+                "external_id": comment.get("id"),
+                "author": comment.get("author"),
+                "message": comment.get("message", {}).get("text"),
+                "post_id": comment.get("object"),
+                "metadata": {
+                    "linkedin_data": event,
+                    "webhook_timestamp": webhook_timestamp
                 }
-                comments.append(comment_data)
-        
-        return comments
+            }
+            for event in payload.get("events", [])
+            if event.get("eventType") == "COMMENT_CREATED"
+            for comment in (event.get("comment", {}),)
+        ]
 
 
 # Webhook processor registry
-WEBHOOK_PROCESSORS = {
+WEBHOOK_PROCESSORS = MappingProxyType({
     "instagram": InstagramWebhookProcessor,
     "twitter": TwitterWebhookProcessor,
     "youtube": YouTubeWebhookProcessor,
     "linkedin": LinkedInWebhookProcessor
-}
+})
 
 
-def get_webhook_processor(platform: str) -> Optional[BaseWebhookProcessor]:
-    """Get webhook processor instance"""
-    processor_class = WEBHOOK_PROCESSORS.get(platform.lower())
+@lru_cache(maxsize=16)
+def _resolve_processor(platform: str) -> Optional[BaseWebhookProcessor]:
+    """Build the processor for a normalized platform name once"""
+    processor_class = WEBHOOK_PROCESSORS.get(platform)
     if processor_class:
         return processor_class()
     return None
+
+
+def get_webhook_processor(platform: str) -> Optional[BaseWebhookProcessor]:
+    """Get webhook processor instance"""
+    return _resolve_processor(platform.lower())
@@ -3,13 +3,19 @@ ARQ worker configuration for background tasks
 """
 
 import asyncio
+from datetime import datetime
 from arq import create_pool
 from arq.connections import RedisSettings
-from typing import Dict, Any
-from uuid import UUID
+from typing import Dict, Any, List
+from uuid import UUID, uuid4
+from sqlalchemy import insert, select
 
+from models.database import Comment, AiSuggestion
+from services.rag_service import get_rag_service
 from utils.config import get_config
+from utils.database import get_session
 from utils.logging import get_logger
+from utils.token_tracker import TokenTracker
 from tasks.webhook_tasks import process_webhook_comments
 from tasks.embedding_tasks import generate_comment_embedding
 from tasks.classification_tasks import classify_comment
@@ -76,13 +82,7 @@ async def submit_reply_task(ctx, reply_id: str, platform: str, team_id: str) ->
 async def generate_suggestions_task(ctx, comment_id: str, team_id: str) -> Dict[str, Any]:
     """Generate AI suggestions in background"""
     try:
-        from services.rag_service import RAGService
-        from models.database import Comment, AiSuggestion
-        from utils.database import get_session
-        from utils.token_tracker import TokenTracker
-        from sqlalchemy import select
-        
-        rag_service = RAGService()
+        rag_service = get_rag_service()
         token_tracker = TokenTracker()
         
         async with get_session() as db:
@@ -110,14 +110,23 @@ async def generate_suggestions_task(ctx, comment_id: str, team_id: str) -> Dict[
                 operation="suggestion_generation"
             )
             
-            # Save suggestions to database
-            for suggestion_text, score in suggestions_data["suggestions"]:
-                suggestion = AiSuggestion(
-                    comment_id=UUID(comment_id),
-                    suggested_reply=suggestion_text,
-                    score=score
+            # Save suggestions with one Core executemany; nothing below needs
+            # the ORM objects, so skip the unit-of-work bookkeeping
+            if suggestions_data["suggestions"]:
+                generated_at = datetime.utcnow()
+                await db.execute(
+                    insert(AiSuggestion.__table__),
+                    [
+                        {
+                            "suggestion_id": uuid4(),
+                            "comment_id": UUID(comment_id),
+                            "suggested_reply": suggestion_text,
+                            "score": score,
+                            "generated_at": generated_at
+                        }
+                        for suggestion_text, score in suggestions_data["suggestions"]
+                    ]
                 )
-                db.add(suggestion)
             
             await db.commit()
             
@@ -21,6 +21,7 @@ class AsyncTaskManager:
     def __init__(self):
         """Initialize task manager with Redis connection pool"""
         self._pool: Optional[Any] = None
+        self._pool_lock = asyncio.Lock()
         self.redis_settings = RedisSettings.from_dsn(config.redis_url)
     
     async def get_pool(self) -> Any:
@@ -31,7 +32,9 @@ class AsyncTaskManager:
             Redis connection pool
         """
         if not self._pool:
-            self._pool = await create_pool(self.redis_settings)
+            async with self._pool_lock:
+                if not self._pool:
+                    self._pool = await create_pool(self.redis_settings)
         return self._pool
     
     async def enqueue_llm_generation(
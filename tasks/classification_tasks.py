@@ -2,12 +2,13 @@
 Background tasks for comment classification
 """
 
+import asyncio
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update
 
 from models.database import Comment
-from services.classification_service import ClassificationService
+from services.classification_service import get_classification_service
 from utils.database import get_session
 from utils.logging import get_logger
 from utils.token_tracker import TokenTracker
@@ -15,11 +16,14 @@ from utils.token_tracker import TokenTracker
 
 logger = get_logger(__name__)
 
+# Maximum concurrent LLM classifications in batch_classify_comments
+BATCH_CONCURRENCY = 8
+
 
 async def classify_comment(comment_id: UUID):
     """Classify a comment (standalone task)"""
     try:
-        classification_service = ClassificationService()
+        classification_service = get_classification_service()
         token_tracker = TokenTracker()
         
         async with get_session() as db:
@@ -36,8 +40,11 @@ async def classify_comment(comment_id: UUID):
                 logger.error(f"Comment {comment_id} has no message to classify")
                 return
             
+            # Normalize metadata once; it may be NULL for freshly ingested comments
+            metadata = comment.metadata or {}
+            
             # Check if already classified
-            if comment.metadata and "classification" in comment.metadata:
+            if "classification" in metadata:
                 logger.info(f"Comment {comment_id} already classified")
                 return
             
@@ -48,7 +55,6 @@ async def classify_comment(comment_id: UUID):
             )
             
             # Update comment metadata
-            metadata = comment.metadata or {}
             metadata["classification"] = classification
             
             stmt = update(Comment).where(
@@ -86,15 +92,23 @@ async def batch_classify_comments(team_id: UUID, limit: int = 100):
             comments = result.scalars().all()
             
             # Filter comments that don't have classification
-            unclassified_comments = []
-            for comment in comments:
-                if not comment.metadata or "classification" not in comment.metadata:
-                    unclassified_comments.append(comment)
-            
-            logger.info(f"Processing {len(unclassified_comments)} comments for classification")
-            
-            for comment in unclassified_comments:
-                await classify_comment(comment.comment_id)
+            unclassified_ids = [
+                comment.comment_id
+                for comment in comments
+                if "classification" not in (comment.metadata or {})
+            ]
+        
+        logger.info(f"Processing {len(unclassified_ids)} comments for classification")
+        
+        # Classification is an LLM round trip per comment, so run them
+        # concurrently; classify_comment logs and absorbs its own failures
+        semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+        
+        async def _classify(comment_id: UUID):
+            async with semaphore:
+                await classify_comment(comment_id)
+        
+        await asyncio.gather(*(_classify(comment_id) for comment_id in unclassified_ids))
             
     except Exception as e:
         logger.error(f"Failed to batch classify comments: {str(e)}")
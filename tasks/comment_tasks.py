@@ -9,8 +9,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update
 
 from models.database import Comment, Team
-from services.vector_service import VectorService
-from services.classification_service import ClassificationService
+from services.vector_service import get_vector_service
+from services.classification_service import get_classification_service
 from utils.database import get_session
 from utils.logging import get_logger
 from utils.token_tracker import TokenTracker
@@ -43,7 +43,6 @@ async def process_comment_embedding(comment_data: Dict[str, Any]):
             
             db.add(comment)
             await db.commit()
-            await db.refresh(comment)
             
             # Process embedding and classification in parallel
             await asyncio.gather(
@@ -59,7 +58,7 @@ async def process_comment_embedding(comment_data: Dict[str, Any]):
 async def generate_comment_embedding(comment_id: UUID):
     """Generate embedding for a comment"""
     try:
-        vector_service = VectorService()
+        vector_service = get_vector_service()
         token_tracker = TokenTracker()
         
         async with get_session() as db:
@@ -99,7 +98,7 @@ async def generate_comment_embedding(comment_id: UUID):
 async def classify_comment_task(comment_id: UUID):
     """Classify a comment"""
     try:
-        classification_service = ClassificationService()
+        classification_service = get_classification_service()
         
         async with get_session() as db:
             # Get comment
@@ -2,12 +2,13 @@
 Background tasks for embedding generation
 """
 
+import asyncio
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update
 
 from models.database import Comment
-from services.vector_service import VectorService
+from services.vector_service import get_vector_service
 from utils.database import get_session
 from utils.logging import get_logger
 from utils.token_tracker import TokenTracker
@@ -15,11 +16,14 @@ from utils.token_tracker import TokenTracker
 
 logger = get_logger(__name__)
 
+# Maximum comments embedded concurrently by batch_generate_embeddings
+BATCH_CONCURRENCY = 10
+
 
 async def generate_comment_embedding(comment_id: UUID):
     """Generate embedding for a comment (standalone task)"""
     try:
-        vector_service = VectorService()
+        vector_service = get_vector_service()
         token_tracker = TokenTracker()
         
         async with get_session() as db:
@@ -68,23 +72,27 @@ async def generate_comment_embedding(comment_id: UUID):
 async def batch_generate_embeddings(team_id: UUID, limit: int = 100):
     """Generate embeddings for comments without embeddings"""
     try:
-        vector_service = VectorService()
-        
         async with get_session() as db:
-            # Get comments without embeddings
-            stmt = select(Comment).where(
+            # Get ids of comments without embeddings; each task loads its own row
+            stmt = select(Comment.comment_id).where(
                 Comment.team_id == team_id,
                 Comment.embedding.is_(None),
                 Comment.message.isnot(None)
             ).limit(limit)
             
             result = await db.execute(stmt)
-            comments = result.scalars().all()
-            
-            logger.info(f"Processing {len(comments)} comments for embedding generation")
-            
-            for comment in comments:
-                await generate_comment_embedding(comment.comment_id)
+            comment_ids = result.scalars().all()
+        
+        logger.info(f"Processing {len(comment_ids)} comments for embedding generation")
+        
+        # Embed comments concurrently; each task handles and logs its own errors
+        semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+        
+        async def _embed(comment_id: UUID):
+            async with semaphore:
+                await generate_comment_embedding(comment_id)
+        
+        await asyncio.gather(*(_embed(comment_id) for comment_id in comment_ids))
             
     except Exception as e:
         logger.error(f"Failed to batch generate embeddings: {str(e)}")
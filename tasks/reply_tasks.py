@@ -5,8 +5,9 @@ Background tasks for reply submission
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.orm import joinedload
 
-from models.database import Reply, Comment, SocialConnection
+from models.database import Reply, SocialConnection
 from services.social_platforms import get_platform_service
 from utils.database import get_session
 from utils.logging import get_logger
@@ -19,8 +20,8 @@ async def submit_reply_to_platform(reply_id: UUID, platform: str, team_id: UUID)
     """Submit reply to social media platform"""
     try:
         async with get_session() as db:
-            # Get reply and comment
-            stmt = select(Reply).where(Reply.reply_id == reply_id)
+            # Get reply and its comment in one round trip
+            stmt = select(Reply).options(joinedload(Reply.comment)).where(Reply.reply_id == reply_id)
             result = await db.execute(stmt)
             reply = result.scalar_one_or_none()
             
@@ -28,9 +29,7 @@ async def submit_reply_to_platform(reply_id: UUID, platform: str, team_id: UUID)
                 logger.error(f"Reply {reply_id} not found")
                 return
             
-            stmt = select(Comment).where(Comment.comment_id == reply.comment_id)
-            result = await db.execute(stmt)
-            comment = result.scalar_one_or_none()
+            comment = reply.comment
             
             if not comment:
                 logger.error(f"Comment {reply.comment_id} not found")
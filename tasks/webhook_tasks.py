@@ -4,14 +4,17 @@ Webhook processing background tasks
 
 from typing import Dict, Any, List
 from uuid import UUID
+from sqlalchemy import select, update
 
 from .base import BaseTask, task_queue
 from services.platforms.registry import get_platform_service
-from services.platforms.base import WebhookPayload, CommentData
-from models.database import Comment
+from services.vector_service import get_vector_service
+from services.classification_service import get_classification_service
+from models.database import Comment, Reply, SocialConnection
 from utils.database import get_session
 from utils.logging import get_logger
 from utils.exceptions import PlatformError, DatabaseError
+from utils.token_tracker import TokenTracker
 
 logger = get_logger(__name__)
 
@@ -29,44 +32,42 @@ class WebhookProcessingTask(BaseTask):
             # Get platform service
             platform_service = get_platform_service(platform)
             
-            # Create webhook payload
-            payload = WebhookPayload(
-                headers=payload_data["headers"],
-                body=payload_data["body"],
-                json_data=payload_data["json_data"]
+            # Extract comments from webhook; the signature was verified on receipt
+            comments_data = await platform_service.process_webhook(
+                payload_data["json_data"],
+                payload_data["headers"]
             )
             
-            # Extract comments from webhook
-            comments_data = await platform_service.ingest_webhook(payload)
-            
-            # Store comments in database
-            comment_ids = []
+            # Store comments in database; ids are generated client-side, so
+            # the whole batch goes out in one flush and commit
+            comments = [
+                Comment(
+                    team_id=payload_data.get("team_id"),  # This should be determined from webhook
+                    platform=platform,
+                    author=comment_data.author,
+                    message=comment_data.message,
+                    metadata={
+                        "external_id": comment_data.external_id,
+                        "post_id": comment_data.post_id,
+                        **comment_data.platform_metadata
+                    }
+                )
+                for comment_data in comments_data
+            ]
             async with get_session() as db:
-                for comment_data in comments_data:
-                    comment = Comment(
-                        team_id=payload_data.get("team_id"),  # This should be determined from webhook
-                        platform=platform,
-                        author=comment_data.author,
-                        message=comment_data.message,
-                        metadata={
-                            "external_id": comment_data.external_id,
-                            "post_id": comment_data.post_id,
-                            **comment_data.platform_metadata
-                        }
-                    )
-                    
-                    db.add(comment)
-                    await db.commit()
-                    await db.refresh(comment)
-                    comment_ids.append(comment.comment_id)
-                    
-                    # Queue embedding and classification tasks
-                    task_queue.add_task(
-                        EmbeddingGenerationTask().run_with_error_handling(comment.comment_id)
-                    )
-                    task_queue.add_task(
-                        CommentClassificationTask().run_with_error_handling(comment.comment_id)
-                    )
+                db.add_all(comments)
+                await db.commit()
+            
+            comment_ids = [comment.comment_id for comment in comments]
+            
+            # Queue embedding and classification tasks once the rows are committed
+            for comment_id in comment_ids:
+                task_queue.add_task(
+                    EmbeddingGenerationTask().run_with_error_handling(comment_id)
+                )
+                task_queue.add_task(
+                    CommentClassificationTask().run_with_error_handling(comment_id)
+                )
             
             return comment_ids
             
@@ -84,11 +85,7 @@ class EmbeddingGenerationTask(BaseTask):
     async def execute(self, comment_id: UUID) -> bool:
         """Generate embedding for a comment"""
         try:
-            from services.vector_service import VectorService
-            from utils.token_tracker import TokenTracker
-            from sqlalchemy import select, update
-            
-            vector_service = VectorService()
+            vector_service = get_vector_service()
             token_tracker = TokenTracker()
             
             async with get_session() as db:
@@ -139,11 +136,7 @@ class CommentClassificationTask(BaseTask):
     async def execute(self, comment_id: UUID) -> bool:
         """Classify a comment"""
         try:
-            from services.classification_service import ClassificationService
-            from utils.token_tracker import TokenTracker
-            from sqlalchemy import select, update
-            
-            classification_service = ClassificationService()
+            classification_service = get_classification_service()
             token_tracker = TokenTracker()
             
             async with get_session() as db:
@@ -155,8 +148,10 @@ class CommentClassificationTask(BaseTask):
                 if not comment or not comment.message:
                     return False
                 
+                metadata = comment.metadata or {}
+                
                 # Check if already classified
-                if comment.metadata and "classification" in comment.metadata:
+                if "classification" in metadata:
                     logger.info(f"Comment {comment_id} already classified")
                     return True
                 
@@ -167,7 +162,6 @@ class CommentClassificationTask(BaseTask):
                 )
                 
                 # Update metadata
-                metadata = comment.metadata or {}
                 metadata["classification"] = classification
                 
                 stmt = update(Comment).where(
@@ -188,7 +182,7 @@ class CommentClassificationTask(BaseTask):
                 return True
                 
         except Exception as e:
-            raise DatabaseError(f"Classification failed for comment {comment_id}", {"error": str(e)}")
+            raise DatabaseError(f"Classification failed for comment {comment_id}", {"error": str(e)})
 
 
 class ReplySubmissionTask(BaseTask):
@@ -201,9 +195,6 @@ class ReplySubmissionTask(BaseTask):
     async def execute(self, reply_id: UUID, platform: str, team_id: UUID) -> bool:
         """Submit reply to platform"""
         try:
-            from models.database import Reply, SocialConnection
-            from sqlalchemy import select
-            
             platform_service = get_platform_service(platform)
             
             async with get_session() as db:
@@ -235,7 +226,7 @@ class ReplySubmissionTask(BaseTask):
                     raise PlatformError(f"No active connection for {platform}")
                 
                 # Get external comment ID
-                external_comment_id = comment.metadata.get("external_id")
+                external_comment_id = (comment.metadata or {}).get("external_id")
                 if not external_comment_id:
                     raise PlatformError("No external comment ID found")
                 
@@ -3,10 +3,11 @@ Unit tests for platform service registry - critical for platform abstraction
 """
 
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from services.platforms.registry import PlatformRegistry, get_platform_service
 from services.platforms.base import BasePlatformService
+from utils.http_client import get_async_client
 
 
 class TestPlatformRegistry:
@@ -77,6 +78,26 @@ class TestPlatformRegistry:
         with pytest.raises(ValueError, match="Unsupported platform: invalid"):
             get_platform_service("invalid")
 
+    @pytest.mark.asyncio
+    async def test_aclose_skips_shared_client(self):
+        """
+        Business Critical: Shutdown must close service-owned clients without
+        closing the pooled client that other callers still share
+        """
+        registry = PlatformRegistry()
+        shared_service = registry.get_service("instagram")
+        owning_service = registry.get_service("twitter")
+        owned_client = MagicMock()
+        owned_client.aclose = AsyncMock()
+        owning_service.client = owned_client
+        
+        await registry.aclose()
+        
+        assert shared_service.client is get_async_client()
+        assert not shared_service.client.is_closed
+        owned_client.aclose.assert_awaited_once()
+        assert registry.get_service("instagram") is not shared_service
+
 
 class TestPlatformServiceInterface:
     """Test that all platform services implement required interface"""
@@ -0,0 +1,77 @@
+"""
+Unit tests for the Twitter platform service - critical for rejecting forged webhooks
+"""
+
+import pytest
+import hmac
+import hashlib
+from unittest.mock import patch
+
+from services.platforms.twitter import TwitterService
+
+
+class TestTwitterService:
+    """Test Twitter webhook verification and comment extraction"""
+
+    @pytest.fixture
+    def twitter_service(self, mock_config):
+        with patch('services.platforms.twitter.get_config', return_value=mock_config):
+            return TwitterService()
+
+    @pytest.mark.asyncio
+    async def test_verify_webhook_signature_valid(self, twitter_service):
+        """
+        Business Critical: Correctly signed Twitter webhooks must be accepted
+        """
+        body = b'{"tweet_create_events": []}'
+        signature = "sha256=" + hmac.new(
+            b"test-twitter-secret",
+            body,
+            hashlib.sha256
+        ).hexdigest()
+
+        is_valid = await twitter_service.verify_webhook_signature(
+            body, {"x-twitter-webhooks-signature": signature}
+        )
+
+        assert is_valid is True
+
+    @pytest.mark.asyncio
+    async def test_verify_webhook_signature_invalid(self, twitter_service):
+        """
+        Business Critical: Forged or unprefixed signatures must be rejected
+        """
+        body = b'{"tweet_create_events": []}'
+        digest = hmac.new(b"test-twitter-secret", body, hashlib.sha256).hexdigest()
+
+        assert await twitter_service.verify_webhook_signature(
+            body, {"x-twitter-webhooks-signature": "sha256=" + "0" * 64}
+        ) is False
+        assert await twitter_service.verify_webhook_signature(
+            body, {"x-twitter-webhooks-signature": digest}
+        ) is False
+        assert await twitter_service.verify_webhook_signature(body, {}) is False
+
+    @pytest.mark.asyncio
+    async def test_process_webhook_extracts_only_replies(self, twitter_service):
+        """
+        Business Critical: Top-level tweets are not comments and must be skipped
+        """
+        payload = {
+            "tweet_create_events": [
+                {"id_str": "1", "text": "new post", "user": {"screen_name": "brand"}},
+                {
+                    "id_str": "2",
+                    "text": "great post",
+                    "user": {"screen_name": "fan"},
+                    "in_reply_to_status_id": 1
+                }
+            ]
+        }
+
+        comments = await twitter_service.process_webhook(payload, {})
+
+        assert len(comments) == 1
+        assert comments[0].external_id == "2"
+        assert comments[0].author == "fan"
+        assert comments[0].post_id == "1"
@@ -173,6 +173,17 @@ class TestWebhookIdempotencyService:
         
         assert hash1 != hash2
 
+    def test_generate_payload_hash_stable_for_non_ascii_payloads(self, service):
+        """
+        Business Critical: Hashes must match those already stored for deduplication,
+        including comments with non-ASCII text
+        """
+        payload = {"id": "123", "text": "Love this caf\u00e9 \u2615 \U0001f389"}
+        
+        payload_hash = service._generate_payload_hash(payload)
+        
+        assert payload_hash == "7d2b0391982b21dd63b535ad9f96805542ac395e25cb20761e4ac05058db3e88"
+
     @pytest.mark.asyncio
     async def test_cleanup_old_events_removes_expired_events(self, service):
         """
@@ -0,0 +1,175 @@
+"""
+Unit tests for outbound platform HTTP handling - critical for staying under API quotas
+"""
+
+import pytest
+import httpx
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import AsyncMock, patch
+
+from utils.http_client import AsyncRateLimiter, RetryTransport
+
+
+class TestAsyncRateLimiter:
+    """Test token bucket pacing of platform requests"""
+
+    @pytest.mark.asyncio
+    async def test_acquire_allows_burst_up_to_rate(self):
+        """
+        Business Critical: Requests within the budget must not be delayed
+        """
+        limiter = AsyncRateLimiter(rate=3, period=60.0)
+
+        with patch("utils.http_client.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            for _ in range(3):
+                await limiter.acquire()
+
+        mock_sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_when_budget_exhausted(self):
+        """
+        Business Critical: Requests beyond the budget must wait for a refill
+        """
+        with patch("utils.http_client.time.monotonic", return_value=1000.0):
+            limiter = AsyncRateLimiter(rate=2, period=60.0)
+
+            with patch("utils.http_client.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+                for _ in range(3):
+                    await limiter.acquire()
+
+        mock_sleep.assert_awaited_once_with(30.0)
+
+
+class TestRetryTransport:
+    """Test retry and backoff of transient platform failures"""
+
+    @staticmethod
+    def _send_responses(*responses):
+        return patch.object(
+            httpx.AsyncHTTPTransport,
+            "handle_async_request",
+            new=AsyncMock(side_effect=list(responses))
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status_code", [429, 500, 502, 503, 504])
+    async def test_retries_transient_status_for_idempotent_requests(self, status_code):
+        """
+        Business Critical: Rate limits and 5xx on reads must be retried with backoff
+        """
+        failed = httpx.Response(status_code)
+        request = httpx.Request("GET", "https://api.example.com/me")
+
+        with self._send_responses(failed, httpx.Response(200)) as mock_send, \
+                patch("utils.http_client.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            response = await RetryTransport().handle_async_request(request)
+
+        assert response.status_code == 200
+        assert mock_send.await_count == 2
+        mock_sleep.assert_awaited_once_with(0.5)
+        assert failed.is_closed
+
+    @pytest.mark.asyncio
+    async def test_does_not_retry_non_idempotent_requests(self):
+        """
+        Business Critical: Replies must never be re-posted, or users see duplicates
+        """
+        request = httpx.Request("POST", "https://api.example.com/tweets")
+
+        with self._send_responses(httpx.Response(503), httpx.Response(200)) as mock_send, \
+                patch("utils.http_client.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            response = await RetryTransport().handle_async_request(request)
+
+        assert response.status_code == 503
+        mock_send.assert_awaited_once()
+        mock_sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self):
+        """
+        Business Critical: Persistent outages must fail instead of retrying forever
+        """
+        request = httpx.Request("GET", "https://api.example.com/me")
+        responses = [httpx.Response(503) for _ in range(4)]
+
+        with self._send_responses(*responses) as mock_send, \
+                patch("utils.http_client.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            response = await RetryTransport().handle_async_request(request)
+
+        assert response is responses[-1]
+        assert mock_send.await_count == 4
+        assert [call.args[0] for call in mock_sleep.await_args_list] == [0.5, 1.0, 2.0]
+        assert all(failed.is_closed for failed in responses[:-1])
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("retry_after", [
+        "60",
+        format_datetime(datetime.now(timezone.utc) + timedelta(minutes=15), usegmt=True),
+    ])
+    async def test_returns_immediately_when_retry_after_exceeds_backoff(self, retry_after):
+        """
+        Business Critical: Retrying inside a long rate-limit window only burns quota
+        """
+        request = httpx.Request("GET", "https://api.example.com/me")
+        limited = httpx.Response(429, headers={"Retry-After": retry_after})
+
+        with self._send_responses(limited, httpx.Response(200)) as mock_send, \
+                patch("utils.http_client.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            response = await RetryTransport().handle_async_request(request)
+
+        assert response is limited
+        mock_send.assert_awaited_once()
+        mock_sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_honors_short_retry_after_http_date(self):
+        """
+        Business Critical: The platform's requested wait must be respected
+        """
+        request = httpx.Request("GET", "https://api.example.com/me")
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=6)
+        limited = httpx.Response(429, headers={"Retry-After": format_datetime(retry_at, usegmt=True)})
+
+        with self._send_responses(limited, httpx.Response(200)), \
+                patch("utils.http_client.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            response = await RetryTransport().handle_async_request(request)
+
+        assert response.status_code == 200
+        delay = mock_sleep.await_args.args[0]
+        assert 4.0 < delay <= 6.0
+
+    @pytest.mark.asyncio
+    async def test_requests_consume_host_rate_limit(self):
+        """
+        Business Critical: Requests beyond a host's budget must wait, other hosts must not
+        """
+        limited = httpx.Request("GET", "https://api.example.com/me")
+        unlimited = httpx.Request("GET", "https://other.example.com/me")
+        responses = [httpx.Response(200) for _ in range(3)]
+
+        with patch.dict("utils.http_client.HOST_RATE_LIMITS", {"api.example.com": (1, 60.0)}), \
+                patch("utils.http_client.time.monotonic", return_value=1000.0), \
+                self._send_responses(*responses), \
+                patch("utils.http_client.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            transport = RetryTransport()
+            await transport.handle_async_request(limited)
+            await transport.handle_async_request(unlimited)
+            mock_sleep.assert_not_called()
+
+            await transport.handle_async_request(limited)
+
+        mock_sleep.assert_awaited_once_with(60.0)
+
+    def test_limiters_are_per_transport(self):
+        """
+        Business Critical: Limiter locks must not be shared across clients and event loops
+        """
+        first, second = RetryTransport(), RetryTransport()
+
+        limiter = first._limiter_for("graph.instagram.com")
+
+        assert limiter is first._limiter_for("graph.instagram.com")
+        assert limiter is not second._limiter_for("graph.instagram.com")
+        assert first._limiter_for("example.com") is None
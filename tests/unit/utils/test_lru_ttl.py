@@ -0,0 +1,47 @@
+"""
+Unit tests for the LRU/TTL cache - critical for never serving stale pricing
+"""
+
+from unittest.mock import patch
+
+from utils.lru_ttl import TTLCache
+
+
+class TestTTLCache:
+    """Test expiry and eviction of cached entries"""
+
+    def test_get_returns_cached_value_before_expiry(self):
+        """
+        Business Critical: Cached values must be served within their TTL
+        """
+        cache = TTLCache(maxsize=4, ttl=60)
+        cache.set("embedding", 0.0001)
+
+        assert cache.get("embedding") == 0.0001
+
+    def test_get_drops_expired_value(self):
+        """
+        Business Critical: Expired entries must not be served
+        """
+        cache = TTLCache(maxsize=4, ttl=60)
+        with patch("utils.lru_ttl.time.monotonic", return_value=1000.0):
+            cache.set("embedding", 0.0001)
+
+        with patch("utils.lru_ttl.time.monotonic", return_value=1060.0):
+            assert cache.get("embedding") is None
+
+        assert len(cache) == 0
+
+    def test_set_evicts_least_recently_used(self):
+        """
+        Business Critical: Cache size must stay bounded
+        """
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
@@ -4,7 +4,8 @@ Authentication utilities for Supabase integration
 
 import os
 import jwt
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 from fastapi import HTTPException, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -17,11 +18,16 @@ from utils.database import get_db
 security = HTTPBearer()
 
 
+@lru_cache()
+def _get_jwt_settings() -> Tuple[Optional[str], Optional[str]]:
+    """Resolve Supabase JWT secret and issuer from the environment once"""
+    return os.getenv("SUPABASE_JWT_SECRET"), os.getenv("SUPABASE_URL")
+
+
 async def verify_supabase_token(token: str) -> dict:
     """Verify Supabase JWT token"""
     try:
-        # Get Supabase JWT secret from environment
-        jwt_secret = os.getenv("SUPABASE_JWT_SECRET")
+        jwt_secret, issuer = _get_jwt_settings()
         if not jwt_secret:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -34,7 +40,7 @@ async def verify_supabase_token(token: str) -> dict:
             jwt_secret,
             algorithms=["HS256"],
             audience="authenticated",
-            issuer=os.getenv("SUPABASE_URL")
+            issuer=issuer
         )
         
         return payload
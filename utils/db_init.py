@@ -88,8 +88,14 @@ async def create_indexes():
                 ON comments(team_id, platform);
             """))
             
+            # Webhook de-duplication looks comments up by platform external id
             await conn.execute(text("""
-                CREATE INDEX IF NOT EXISTS idx_comments_created_at 
+                CREATE INDEX IF NOT EXISTS idx_comments_external_team_platform
+                ON comments((metadata->>'external_id'), team_id, platform);
+            """))
+
+            await conn.execute(text("""
+                CREATE INDEX IF NOT EXISTS idx_comments_created_at
                 ON comments(created_at DESC);
             """))
             
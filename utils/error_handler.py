@@ -8,7 +8,7 @@ from typing import Union
 from fastapi import Request, HTTPException
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
-from datetime import datetime
+from datetime import datetime, timezone
 
 from utils.exceptions import (
     PulsePilotException, 
@@ -112,6 +112,6 @@ class GlobalExceptionHandler(BaseHTTPMiddleware):
                 "error": message,
                 "details": details,
                 "status_code": status_code,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": datetime.now(timezone.utc).isoformat()
             }
         )
@@ -0,0 +1,26 @@
+"""
+Fast JSON decoding with orjson and a stdlib fallback
+"""
+
+import json
+from typing import Any, Union
+
+import httpx
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode JSON directly from bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def response_json(response: httpx.Response) -> Any:
+    """Decode an httpx response body without the intermediate str allocation"""
+    return loads(response.content)
+
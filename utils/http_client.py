@@ -0,0 +1,171 @@
+"""
+HTTP client construction for platform API calls
+"""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from importlib.util import find_spec
+from typing import Dict, Optional
+
+import httpx
+
+
+# Connection failures are retried by httpx itself (safe for any method)
+CONNECT_RETRIES = 3
+
+# Transient statuses retried with backoff for idempotent requests only
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+RETRY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.5
+MAX_BACKOFF = 10.0
+
+# Sized for every platform service sharing one pool, so bursts of small
+# API calls reuse warm TLS connections instead of handshaking again
+DEFAULT_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=100)
+DEFAULT_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+
+# HTTP/2 multiplexes concurrent platform calls over one connection; it needs
+# the optional h2 package (httpx[http2]) and falls back to HTTP/1.1 without it
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
+# Outbound request budget per platform host as (requests, period seconds),
+# kept under the documented app-level quotas so fan-outs don't trigger 429s
+HOST_RATE_LIMITS = {
+    "graph.instagram.com": (200, 60.0),
+    "api.linkedin.com": (100, 60.0),
+    "api.twitter.com": (300, 60.0),
+    "www.googleapis.com": (300, 60.0),
+}
+
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+class AsyncRateLimiter:
+    """Token bucket allowing rate requests per period, with bursts up to rate"""
+
+    def __init__(self, rate: int, period: float):
+        self.rate = rate
+        self.period = period
+        self._tokens = float(rate)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request slot is available and take it"""
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) * self.period / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            float(self.rate),
+            self._tokens + (now - self._updated_at) * self.rate / self.period
+        )
+        self._updated_at = now
+
+
+class RetryTransport(httpx.AsyncHTTPTransport):
+    """Async transport that rate limits per host and retries rate-limited and 5xx idempotent requests"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Limiters hold asyncio locks, so they live and die with the transport
+        # and the event loop it runs on instead of being shared process-wide
+        self._limiters: Dict[str, AsyncRateLimiter] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        limiter = self._limiter_for(request.url.host)
+        response = await self._send(request, limiter)
+        if request.method not in RETRY_METHODS:
+            return response
+
+        for attempt in range(MAX_RETRIES):
+            if response.status_code not in RETRY_STATUS_CODES:
+                break
+            delay = _retry_delay(response, attempt)
+            if delay is None:
+                break
+            await response.aclose()
+            await asyncio.sleep(delay)
+            response = await self._send(request, limiter)
+
+        return response
+
+    def _limiter_for(self, host: str) -> Optional[AsyncRateLimiter]:
+        """Return the host's limiter, creating it on first use"""
+        limiter = self._limiters.get(host)
+        if limiter is None and host in HOST_RATE_LIMITS:
+            rate, period = HOST_RATE_LIMITS[host]
+            limiter = self._limiters[host] = AsyncRateLimiter(rate, period)
+        return limiter
+
+    async def _send(
+        self,
+        request: httpx.Request,
+        limiter: Optional[AsyncRateLimiter]
+    ) -> httpx.Response:
+        if limiter is not None:
+            await limiter.acquire()
+        return await super().handle_async_request(request)
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> Optional[float]:
+    """Delay before retrying, or None when the platform asks for a longer wait"""
+    retry_after = _retry_after_seconds(response.headers.get("Retry-After"))
+    if retry_after is None:
+        return min(BACKOFF_FACTOR * (2 ** attempt), MAX_BACKOFF)
+    # Retrying inside a longer rate-limit window only spends more quota
+    if retry_after > MAX_BACKOFF:
+        return None
+    return retry_after
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given as delay-seconds or an HTTP-date"""
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def create_async_client(
+    limits: Optional[httpx.Limits] = None,
+    **kwargs
+) -> httpx.AsyncClient:
+    """Create an AsyncClient with per-host rate limits, connect retries and transient-error backoff"""
+    transport = RetryTransport(
+        retries=CONNECT_RETRIES,
+        limits=limits or DEFAULT_LIMITS,
+        http2=HTTP2_AVAILABLE
+    )
+    return httpx.AsyncClient(transport=transport, **kwargs)
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Get the process-wide pooled client shared by platform services"""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = create_async_client(timeout=DEFAULT_TIMEOUT)
+    return _shared_client
+
+
+async def close_async_client() -> None:
+    """Close the shared client; called once on application shutdown"""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
@@ -5,7 +5,7 @@ Logging configuration and utilities
 import os
 import logging
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, Any
 
 
@@ -68,7 +68,7 @@ class StructuredLogger:
                 "endpoint": endpoint,
                 "team_id": team_id,
                 "user_id": user_id,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
                 **kwargs
             }
         )
@@ -94,7 +94,7 @@ class StructuredLogger:
                 "response_time_ms": response_time_ms,
                 "team_id": team_id,
                 "user_id": user_id,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
                 **kwargs
             }
         )
@@ -113,7 +113,7 @@ class StructuredLogger:
                 "error_type": type(error).__name__,
                 "error_message": str(error),
                 "context": context or {},
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
                 **kwargs
             }
         )
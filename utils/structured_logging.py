@@ -5,7 +5,7 @@ Structured JSON logging with request context
 import json
 import logging
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, Any, Optional
 from uuid import uuid4
 from contextvars import ContextVar
@@ -30,7 +30,7 @@ class StructuredFormatter(logging.Formatter):
             JSON formatted log string
         """
         log_data = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -2,6 +2,7 @@
 Task queue utility for background job management
 """
 
+import asyncio
 from typing import Any, Dict
 from uuid import UUID
 from arq import create_pool
@@ -19,11 +20,15 @@ class TaskQueue:
     
     def __init__(self):
         self._pool = None
+        self._pool_lock = asyncio.Lock()
     
     async def get_pool(self):
         """Get Redis pool for ARQ"""
         if not self._pool:
-            self._pool = await create_pool(RedisSettings.from_dsn(config.redis_url))
+            # Concurrent first callers must share one pool, not each open their own
+            async with self._pool_lock:
+                if not self._pool:
+                    self._pool = await create_pool(RedisSettings.from_dsn(config.redis_url))
         return self._pool
     
     async def enqueue_webhook_processing(self, platform: str, payload_data: Dict[str, Any]) -> str:
@@ -3,7 +3,7 @@ Enhanced token usage tracking utility for billing with LLM integration
 """
 
 from uuid import UUID
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
@@ -11,9 +11,20 @@ from sqlalchemy import select, func
 from models.database import TokenUsage, Pricing, Subscription
 from utils.database import get_session
 from utils.logging import get_logger
+from utils.lru_ttl import TTLCache
 
 logger = get_logger(__name__)
 
+# Pricing rows change rarely but are read on every tracked usage
+PRICING_CACHE_TTL_SECONDS = 300
+_price_cache = TTLCache(maxsize=64, ttl=PRICING_CACHE_TTL_SECONDS)
+
+DEFAULT_PRICES = {
+    "embedding": 0.0001,
+    "classification": 0.0002,
+    "generation": 0.002
+}
+
 
 class TokenTracker:
     """Enhanced utility for tracking token usage and calculating costs"""
@@ -72,7 +83,7 @@ class TokenTracker:
             "prompt_tokens": prompt_tokens,
             "completion_tokens": completion_tokens,
             "operation": operation,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": datetime.now(timezone.utc).isoformat()
         }
         
         return await self.track_usage(
@@ -162,24 +173,21 @@ class TokenTracker:
     ) -> float:
         """Calculate cost based on current pricing"""
         
-        # Get current pricing
-        stmt = select(Pricing).where(
-            Pricing.usage_type == usage_type
-        ).order_by(Pricing.effective_date.desc())
-        
-        result = await db.execute(stmt)
-        pricing = result.scalar_one_or_none()
-        
-        if not pricing:
-            # Default pricing if not found
-            default_prices = {
-                "embedding": 0.0001,
-                "classification": 0.0002,
-                "generation": 0.002
-            }
-            price_per_token = default_prices.get(usage_type, 0.001)
-        else:
-            price_per_token = pricing.price_per_token
+        price_per_token = _price_cache.get(usage_type)
+        if price_per_token is None:
+            # Get current pricing
+            stmt = select(Pricing.price_per_token).where(
+                Pricing.usage_type == usage_type
+            ).order_by(Pricing.effective_date.desc()).limit(1)
+            
+            result = await db.execute(stmt)
+            price_per_token = result.scalar_one_or_none()
+            
+            if price_per_token is None:
+                # Default pricing if not found
+                price_per_token = DEFAULT_PRICES.get(usage_type, 0.001)
+            
+            _price_cache.set(usage_type, price_per_token)
         
         return tokens_used * price_per_token
     
@@ -219,16 +227,15 @@ class TokenTracker:
             ).group_by(TokenUsage.usage_type)
             
             result = await db.execute(stmt)
-            usage_breakdown = {}
-            total_tokens_used = 0
-            
-            for row in result.fetchall():
-                usage_breakdown[row.usage_type] = {
+            usage_breakdown = {
+                row.usage_type: {
                     "tokens": int(row.total_tokens or 0),
                     "cost": float(row.total_cost or 0),
                     "count": int(row.usage_count or 0)
                 }
-                total_tokens_used += int(row.total_tokens or 0)
+                for row in result.fetchall()
+            }
+            total_tokens_used = sum(usage["tokens"] for usage in usage_breakdown.values())
             
             tokens_remaining = max(0, subscription.monthly_token_quota - total_tokens_used)
             
@@ -266,11 +273,7 @@ class TokenTracker:
             daily_usage = {}
             
             for row in result.fetchall():
-                date_str = row.date.isoformat()
-                if date_str not in daily_usage:
-                    daily_usage[date_str] = {}
-                
-                daily_usage[date_str][row.usage_type] = {
+                daily_usage.setdefault(row.date.isoformat(), {})[row.usage_type] = {
                     "tokens": int(row.tokens or 0),
                     "cost": float(row.cost or 0)
                 }
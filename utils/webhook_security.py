@@ -2,32 +2,86 @@
 Webhook security utilities for signature verification and logging
 """
 
+import asyncio
 import hmac
 import hashlib
 import json
 from typing import Dict, Any, Optional
 from fastapi import Request, HTTPException, status
 import base64
-from datetime import datetime
+from datetime import datetime, timezone
 
 from utils.config import get_config
 from utils.logging import get_logger
 from utils.monitoring import track_webhook_metrics
 
 logger = get_logger(__name__)
-config = get_config()
+
+SHA256_PREFIX = "sha256="
+
+# Bodies at least this large are hashed off the event loop; hashlib releases
+# the GIL while hashing, and below this the thread hop costs more than it saves
+HMAC_OFFLOAD_BYTES = 64 * 1024
+
+
+def hmac_template(secret: Optional[str]) -> Optional["hmac.HMAC"]:
+    """Build a pre-keyed HMAC-SHA256 object; copy() it per message to skip key setup"""
+    if not secret:
+        return None
+    return hmac.new(secret.encode(), digestmod=hashlib.sha256)
+
+
+async def _sign(template: "hmac.HMAC", body: bytes) -> "hmac.HMAC":
+    """HMAC a webhook body from a pre-keyed template without stalling the loop"""
+    mac = template.copy()
+    if len(body) >= HMAC_OFFLOAD_BYTES:
+        await asyncio.to_thread(mac.update, body)
+    else:
+        mac.update(body)
+    return mac
+
+
+async def verify_hmac_signature(template: "hmac.HMAC", body: bytes, signature: str) -> bool:
+    """Check a hex HMAC-SHA256 signature of body, without any scheme prefix"""
+    # Compare raw 32-byte digests instead of hex-encoding ours
+    try:
+        signature_digest = bytes.fromhex(signature)
+    except ValueError:
+        return False
+    
+    mac = await _sign(template, body)
+    return hmac.compare_digest(mac.digest(), signature_digest)
 
 
 class WebhookSecurityManager:
     """Manages webhook security verification for all platforms"""
     
     def __init__(self):
+        self._app_config = get_config()
+        # Pre-keyed HMAC objects per secret setting, built on first use
+        self._hmac_templates: Dict[str, Optional["hmac.HMAC"]] = {}
+        
         self.platform_verifiers = {
             "instagram": self._verify_instagram_signature,
             "twitter": self._verify_twitter_signature,
             "youtube": self._verify_youtube_signature,
             "linkedin": self._verify_linkedin_signature,
         }
+        self.challenge_handlers = {
+            "instagram": self._handle_facebook_challenge,
+            "facebook": self._handle_facebook_challenge,
+            "twitter": self._handle_twitter_challenge,
+            "youtube": self._handle_youtube_challenge,
+            "linkedin": self._handle_linkedin_challenge,
+        }
+    
+    def _get_hmac_template(self, secret_name: str) -> Optional["hmac.HMAC"]:
+        """Return the pre-keyed HMAC for a secret setting, keying it once"""
+        if secret_name not in self._hmac_templates:
+            self._hmac_templates[secret_name] = hmac_template(
+                getattr(self._app_config, secret_name, None)
+            )
+        return self._hmac_templates[secret_name]
     
     async def verify_webhook(
         self, 
@@ -85,38 +139,28 @@ class WebhookSecurityManager:
     async def _verify_instagram_signature(self, body: bytes, headers: Dict[str, str]) -> bool:
         """Verify Instagram webhook signature"""
         signature = headers.get("x-hub-signature-256", "")
-        if not signature:
+        if not signature.startswith(SHA256_PREFIX):
             return False
         
-        if not config.instagram_app_secret:
+        template = self._get_hmac_template("instagram_app_secret")
+        if template is None:
             logger.error("Instagram app secret not configured")
             return False
         
-        expected_signature = "sha256=" + hmac.new(
-            config.instagram_app_secret.encode(),
-            body,
-            hashlib.sha256
-        ).hexdigest()
-        
-        return hmac.compare_digest(signature, expected_signature)
+        return await verify_hmac_signature(template, body, signature[len(SHA256_PREFIX):])
     
     async def _verify_twitter_signature(self, body: bytes, headers: Dict[str, str]) -> bool:
         """Verify Twitter webhook signature"""
         signature = headers.get("x-twitter-webhooks-signature", "")
-        if not signature:
+        if not signature.startswith(SHA256_PREFIX):
             return False
         
-        if not config.twitter_consumer_secret:
+        template = self._get_hmac_template("twitter_consumer_secret")
+        if template is None:
             logger.error("Twitter consumer secret not configured")
             return False
         
-        expected_signature = "sha256=" + hmac.new(
-            config.twitter_consumer_secret.encode(),
-            body,
-            hashlib.sha256
-        ).hexdigest()
-        
-        return hmac.compare_digest(signature, expected_signature)
+        return await verify_hmac_signature(template, body, signature[len(SHA256_PREFIX):])
     
     async def _verify_youtube_signature(self, body: bytes, headers: Dict[str, str]) -> bool:
         """Verify YouTube webhook (PubSubHubbub doesn't use signatures)"""
@@ -130,17 +174,12 @@ class WebhookSecurityManager:
         if not signature:
             return False
         
-        if not config.linkedin_client_secret:
+        template = self._get_hmac_template("linkedin_client_secret")
+        if template is None:
             logger.error("LinkedIn client secret not configured")
             return False
         
-        expected_signature = hmac.new(
-            config.linkedin_client_secret.encode(),
-            body,
-            hashlib.sha256
-        ).hexdigest()
-        
-        return hmac.compare_digest(signature, expected_signature)
+        return await verify_hmac_signature(template, body, signature)
     
     async def handle_webhook_challenge(
         self,
@@ -149,19 +188,14 @@ class WebhookSecurityManager:
     ) -> Any:
         """Handle webhook subscription challenges for all platforms"""
         
-        if platform.lower() in ["instagram", "facebook"]:
-            return await self._handle_facebook_challenge(request)
-        elif platform.lower() == "twitter":
-            return await self._handle_twitter_challenge(request)
-        elif platform.lower() == "youtube":
-            return await self._handle_youtube_challenge(request)
-        elif platform.lower() == "linkedin":
-            return await self._handle_linkedin_challenge(request)
-        else:
+        handler = self.challenge_handlers.get(platform.lower())
+        if not handler:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Challenge handling not supported for {platform}"
             )
+        
+        return await handler(request)
 
     async def _handle_facebook_challenge(self, request: Request) -> int:
         """Handle Facebook/Instagram webhook challenge"""
@@ -169,7 +203,7 @@ class WebhookSecurityManager:
         hub_challenge = request.query_params.get("hub.challenge")
         hub_verify_token = request.query_params.get("hub.verify_token")
         
-        expected_verify_token = config.webhook_secret_key[:16]  # Use part of secret as verify token
+        expected_verify_token = self._app_config.webhook_secret_key[:16]  # Use part of secret as verify token
         
         if hub_mode == "subscribe" and hub_verify_token == expected_verify_token:
             logger.info("Facebook/Instagram webhook challenge verified")
@@ -191,18 +225,18 @@ class WebhookSecurityManager:
                 detail="Missing crc_token parameter"
             )
         
-        # Create CRC response
-        import hmac
-        import hashlib
-        import base64
+        template = self._get_hmac_template("twitter_consumer_secret")
+        if template is None:
+            logger.error("Twitter consumer secret not configured")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Twitter webhook secret not configured"
+            )
         
-        signature = hmac.new(
-            config.twitter_consumer_secret.encode(),
-            crc_token.encode(),
-            hashlib.sha256
-        ).digest()
+        # Create CRC response
+        mac = await _sign(template, crc_token.encode())
         
-        response_token = base64.b64encode(signature).decode()
+        response_token = base64.b64encode(mac.digest()).decode()
         
         logger.info("Twitter webhook CRC challenge verified")
         return {"response_token": f"sha256={response_token}"}
@@ -244,7 +278,7 @@ class WebhookSecurityManager:
             "success": success,
             "ip_address": request.client.host if request.client else None,
             "user_agent": request.headers.get("user-agent"),
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
             "details": details or {}
         }
         
@@ -272,7 +306,7 @@ class WebhookSecurityManager:
             "user_agent": request.headers.get("user-agent"),
             "content_type": request.headers.get("content-type"),
             "content_length": request.headers.get("content-length"),
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": datetime.now(timezone.utc).isoformat()
         }
         
         if error: